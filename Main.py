@@ -9,6 +9,5 @@ if __name__ == '__main__':
 """Launcher for calculator GUI (cleaned).
 
 This file is a minimal entrypoint that uses the clean GUI implementation
-from `calculator.gui` (which re-exports the working code from
-`calculator.gui_new`).
+from `calculator.gui` (`calculator.gui_new` re-exports it for launcher.py).
 """
\ No newline at end of file
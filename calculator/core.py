@@ -3,6 +3,7 @@ Core math helpers for the calculator.
 This keeps computation separate from the UI.
 """
 import math
+from functools import lru_cache
 
 def to_number(s):
     try:
@@ -10,15 +11,19 @@ def to_number(s):
     except Exception:
         raise ValueError("Invalid number")
 
+@lru_cache(maxsize=512)
+def _format_float(fv):
+    if math.isfinite(fv) and fv.is_integer():
+        return str(int(fv))
+    # limit to reasonable precision
+    return f"{fv:.10g}"
+
 def format_result(v):
     try:
         fv = float(v)
-        if math.isfinite(fv) and fv.is_integer():
-            return str(int(fv))
-        # limit to reasonable precision
-        return f"{fv:.10g}"
     except Exception:
         return str(v)
+    return _format_float(fv)
 
 def safe_add(a, b):
     return a + b
@@ -3,10 +3,167 @@ Graphing functionality similar to TI-84 calculators.
 Handles function plotting and window management.
 """
 import re
+from collections import OrderedDict
+from functools import lru_cache
+
 import numpy as np
+from PyQt5.QtCore import QTimer
 from matplotlib.figure import Figure
+from matplotlib.ticker import MultipleLocator
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 
+try:
+    import numexpr as ne
+except ImportError:  # optional accelerator, fall back to numpy eval
+    ne = None
+
+try:
+    from scipy.optimize import brentq
+except ImportError:  # fall back to the bisection in _binary_search_zero
+    brentq = None
+
+try:
+    import numba
+except ImportError:  # optional accelerator, scalar paths stay in Python
+    numba = None
+
+# Namespace for evaluating prepared expressions (no builtins exposed)
+_EVAL_GLOBALS = {'np': np, '__builtins__': {}}
+
+
+# TI-84 style names and their numpy spellings
+_SUBST = {
+    'sin': 'np.sin', 'cos': 'np.cos', 'tan': 'np.tan',
+    'asin': 'np.arcsin', 'acos': 'np.arccos', 'atan': 'np.arctan',
+    'log': 'np.log10', 'ln': 'np.log', 'exp': 'np.exp',
+    'sqrt': 'np.sqrt', 'abs': 'np.abs',
+    'pi': 'np.pi', 'e': 'np.e',
+}
+
+# numexpr knows the bare function names; constants are inlined as literals
+_NE_SUBST = {name: value[3:] for name, value in _SUBST.items()}
+_NE_SUBST.update(pi=repr(np.pi), e=repr(np.e))
+
+# Names a prepared expression may use (numpy spellings of the _SUBST entries)
+_PREPARED_NAMES = frozenset({'np', 'x'} | {value[3:] for value in _SUBST.values()})
+
+# Single pass over the expression: scientific literals (kept as is), the
+# power operator, implicit multiplication after a number (2x -> 2*x),
+# function calls and constants
+_TOKEN_RE = re.compile(
+    r'(?:\d+\.?\d*|\.\d+)e[-+]?\d+'
+    r'|\^'
+    r'|(?<=\d)(?=[a-z])'
+    r'|(?<![a-z_.])(asin|acos|atan|sin|cos|tan|log|ln|exp|sqrt|abs)(?=\()'
+    r'|(?<![a-z_.])(pi|e)(?![a-z0-9_])'
+)
+
+
+def _rewrite(expr, names):
+    """Apply the single-pass token rewrite using the given name table"""
+    def substitute(match):
+        name = match.group(1) or match.group(2)
+        if name:
+            return names[name]
+        token = match.group()
+        if token == '^':
+            return '**'
+        return token or '*'
+    return _TOKEN_RE.sub(substitute, expr.lower())
+
+
+@lru_cache(maxsize=256)
+def prepare_expression(expr):
+    """Convert a TI-84 style expression to numpy form"""
+    return _rewrite(expr, _SUBST)
+
+
+def prepare_numexpr(expr):
+    """Convert a TI-84 style expression to numexpr form"""
+    return _rewrite(expr, _NE_SUBST)
+
+
+# NumExpr input types keyed by numpy dtype char (numexpr spells float32 as float)
+_NE_KINDS = {'f': float, 'd': np.float64}
+
+
+@lru_cache(maxsize=128)
+def _numexpr_kernel(expr, kind='d'):
+    """Compile an expression to a reusable NumExpr kernel (None if unsupported)"""
+    if ne is None:
+        return None
+    try:
+        # numexpr knows more names (sinh, where, ...) than the numpy and
+        # scalar paths; keep every path on the same expression language
+        if not _PREPARED_NAMES.issuperset(compile_expression(expr).co_names):
+            return None
+        return ne.NumExpr(prepare_numexpr(expr), signature=(('x', _NE_KINDS[kind]),))
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=256)
+def compile_expression(expr):
+    """Return the cached code object for an expression, compiling on first use"""
+    return compile(prepare_expression(expr), '<graph>', 'eval')
+
+
+@lru_cache(maxsize=128)
+def _as_callable(expr):
+    """Build a plain Python function f(x) for an expression"""
+    return eval('lambda x: ' + prepare_expression(expr), _EVAL_GLOBALS)
+
+
+@lru_cache(maxsize=64)
+def _jit_scalar(expr):
+    """Build a scalar f(x) for an expression, JIT-compiled when numba is available"""
+    fn = _as_callable(expr)
+    if numba is None:
+        return fn
+    try:
+        # Fix the signature so integer x is promoted to float64, never int64
+        return numba.njit('f8(f8)')(fn)
+    except numba.core.errors.NumbaError:
+        return fn
+
+
+@lru_cache(maxsize=16)
+def _sample_grid(start, end, points):
+    """Return a shared read-only sample grid for the analysis functions"""
+    x = np.linspace(start, end, points)
+    x.flags.writeable = False
+    return x
+
+
+def _sign_changes(y):
+    """Indices i where y changes sign between samples i and i+1"""
+    negative = np.signbit(y)
+    finite = np.isfinite(y)
+    return np.flatnonzero((negative[:-1] != negative[1:]) & finite[:-1] & finite[1:])
+
+
+def evaluate_expression(expr, x, out=None):
+    """Evaluate an expression over x, preferring a fused numexpr kernel
+
+    When ``out`` is given the result is written into it and returned.
+    """
+    kernel = _numexpr_kernel(expr, x.dtype.char)
+    if kernel is not None:
+        if out is None:
+            return kernel(x)
+        if chr(kernel.fullsig[0]) != out.dtype.char:
+            # Float literals promote float32 input to float64 results
+            out[...] = kernel(x)
+            return out
+        # Passing any keyword requires ex_uses_vml; the non-VML path is
+        # always available and gives the same results
+        return kernel(x, out=out, ex_uses_vml=False)
+    y = eval(compile_expression(expr), _EVAL_GLOBALS, {'x': x})
+    if out is None:
+        return y
+    out[...] = y
+    return out
+
 
 class GraphCanvas(FigureCanvasQTAgg):
     def __init__(self, parent=None, width=5, height=4, dpi=100):
@@ -25,6 +182,33 @@ class GraphCanvas(FigureCanvasQTAgg):
         # Pan tracking
         self._pan_start = None
         
+        # Sample grid reused until the x-range changes
+        self._x_cache = None
+        self._x_key = None
+        # Curve sampling dtype. float32 halves the curve buffers but loses
+        # digits to cancellation (e.g. (x+1)^2-x^2-2x near x=1e4), so it is
+        # opt-in; analysis always samples in float64
+        self._interactive_dtype = np.float64
+        
+        # Coalesce pan/zoom redraws to at most one per frame (~60/s)
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._redraw)
+        
+        # Persistent curve artists, updated in place on pan/zoom
+        self._func_lines = {}
+        
+        # Enable mouse pan and zoom
+        self.mpl_connect('button_press_event', self.on_mouse_press)
+        self.mpl_connect('button_release_event', self.on_mouse_release)
+        self.mpl_connect('motion_notify_event', self.on_mouse_move)
+        self.mpl_connect('scroll_event', self.on_scroll)
+        
+        # Set once a full draw has rendered, so overlays can be blitted
+        self._drawn = False
+        self.mpl_connect('draw_event', self._on_draw_event)
+        
         self.setup_axes()
     
     def setup_axes(self):
@@ -33,94 +217,126 @@ class GraphCanvas(FigureCanvasQTAgg):
         self.axes.grid(True)
         self.axes.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
         self.axes.axvline(x=0, color='k', linestyle='-', linewidth=0.5)
-        self.axes.set_xlim(self.xmin, self.xmax)
-        self.axes.set_ylim(self.ymin, self.ymax)
-        # Set major ticks according to scale
-        self.axes.set_xticks(np.arange(self.xmin, self.xmax + 1, self.xscl))
-        self.axes.set_yticks(np.arange(self.ymin, self.ymax + 1, self.yscl))
-        
-        # Enable mouse pan and zoom
-        self.fig.canvas.mpl_connect('button_press_event', self.on_mouse_press)
-        self.fig.canvas.mpl_connect('button_release_event', self.on_mouse_release)
-        self.fig.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
-        self.fig.canvas.mpl_connect('scroll_event', self.on_scroll)
+        self._apply_window()
         
         # Store initial view for reset
         self._default_xlim = (self.xmin, self.xmax)
         self._default_ylim = (self.ymin, self.ymax)
+        
+        # clear() dropped the curve artists, so add them back
+        exprs = list(self._func_lines)
+        self._func_lines.clear()
+        self._update_lines(exprs)
+    
+    def _apply_window(self):
+        """Apply the window ranges and tick spacing to the existing axes"""
+        self.axes.set_xlim(self.xmin, self.xmax)
+        self.axes.set_ylim(self.ymin, self.ymax)
+        # Major ticks every scale unit from the origin; the locators follow
+        # the view, so panning doesn't need to recompute them
+        self.axes.xaxis.set_major_locator(MultipleLocator(self.xscl))
+        self.axes.yaxis.set_major_locator(MultipleLocator(self.yscl))
     
     def set_window(self, xmin, xmax, ymin, ymax, xscl=1, yscl=1):
         """Update window ranges and redraw"""
-        self.xmin = float(xmin)
-        self.xmax = float(xmax)
-        self.ymin = float(ymin)
-        self.ymax = float(ymax)
+        ranges = (float(xmin), float(xmax), float(ymin), float(ymax))
+        same_ranges = ranges == (self.xmin, self.xmax, self.ymin, self.ymax)
+        self.xmin, self.xmax, self.ymin, self.ymax = ranges
         self.xscl = float(xscl)
         self.yscl = float(yscl)
-        self.setup_axes()
-        self.draw()
+        # Store the new view for reset, as setup_axes does
+        self._default_xlim = (self.xmin, self.xmax)
+        self._default_ylim = (self.ymin, self.ymax)
+        # Keep the axes and artists; only limits, ticks and samples change
+        self._apply_window()
+        if not same_ranges:
+            self._update_lines(list(self._func_lines))
+        self.draw_idle()
         
     def plot_point(self, x, y, color='red', marker='o'):
         """Plot a point on the graph"""
-        self.axes.plot(x, y, color=color, marker=marker, markersize=8)
-        self.draw()
+        self.plot_points([x], [y], color, marker)
+        
+    def plot_points(self, xs, ys, color='red', marker='o'):
+        """Plot several points as one marker-only artist"""
+        points, = self.axes.plot(xs, ys, color=color, marker=marker,
+                                 markersize=8, linestyle='none')
+        if not self._drawn:
+            self.draw()
+            return
+        # The axes/grid/curves are unchanged, so paint only the new markers
+        # over the last rendered frame and blit the axes region
+        self.axes.draw_artist(points)
+        self.blit(self.axes.bbox)
+        
+    def _on_draw_event(self, event):
+        """Remember that the Agg buffer holds a complete frame"""
+        self._drawn = True
         
     def clear_points(self):
         """Clear all plotted points"""
+        # setup_axes() keeps the plotted functions
         self.setup_axes()
-        # Replot all functions
-        for func in self.parent().graph_calc.get_functions():
-            self.plot_function(func)
         self.draw()
         
     def trace_function(self, expr, x):
         """Find y value for given x on function"""
         try:
-            expr = self.prepare_expression(expr)
-            y = eval(expr.replace('x', f'({x})'))
-            return float(y)
+            return float(_jit_scalar(expr)(float(x)))
         except Exception:
             return None
     
     def plot_function(self, expr):
         """Plot a mathematical expression"""
-        try:
-            # Create x points for smooth plotting
-            x = np.linspace(self.xmin, self.xmax, 500)
-            
-            # Convert the expression to numpy-compatible form
-            expr = self.prepare_expression(expr)
-            
-            # Evaluate using numpy
-            y = eval(expr)
-            
-            # Plot and refresh
-            self.axes.plot(x, y)
-            self.draw()
-            return True
-        except Exception as e:
-            print(f"Error plotting: {e}")
-            return False
+        return self.plot_functions([expr])
+    
+    def plot_functions(self, exprs):
+        """Plot several expressions, evaluated into one shared buffer"""
+        plotted = self._update_lines(exprs)
+        self.draw_idle()
+        return plotted
+    
+    def _update_lines(self, exprs):
+        """Evaluate expressions over the x-grid and update or add their curves"""
+        # Create x points for smooth plotting
+        x = self._x_grid()
+        
+        # One allocation for every curve; each line keeps its own row
+        ys = np.empty((len(exprs), x.size), dtype=x.dtype)
+        plotted = True
+        for expr, y in zip(exprs, ys):
+            try:
+                # Evaluate the cached expression (numexpr or numpy)
+                evaluate_expression(expr, x, out=y)
+            except Exception as e:
+                print(f"Error plotting: {e}")
+                plotted = False
+                continue
+            line = self._func_lines.get(expr)
+            if line is None:
+                line, = self.axes.plot(x, y)
+                self._func_lines[expr] = line
+            else:
+                line.set_data(x, y)
+        return plotted
     
-    def prepare_expression(self, expr):
-        """Convert a TI-84 style expression to numpy form"""
-        # Replace common mathematical operations
-        expr = expr.lower()
-        expr = re.sub(r'\^', '**', expr)  # power
-        expr = re.sub(r'sin\(', 'np.sin(', expr)
-        expr = re.sub(r'cos\(', 'np.cos(', expr)
-        expr = re.sub(r'tan\(', 'np.tan(', expr)
-        expr = re.sub(r'log\(', 'np.log10(', expr)
-        expr = re.sub(r'ln\(', 'np.log(', expr)
-        expr = re.sub(r'sqrt\(', 'np.sqrt(', expr)
-        expr = re.sub(r'abs\(', 'np.abs(', expr)
-        expr = re.sub(r'pi\b', 'np.pi', expr)
-        expr = re.sub(r'e\b', 'np.e', expr)
-        
-        # Ensure multiplication is explicit (2x -> 2*x)
-        expr = re.sub(r'(\d+)([a-zA-Z])', r'\1*\2', expr)
-        
-        return expr.replace('x', '(x)')
+    def _x_grid(self, points=500):
+        """Return the sample grid for the current x-range, rebuilt only on change"""
+        dtype = self._interactive_dtype
+        # float32 cannot resolve the curve once zoomed far in around large
+        # x, or around large y (e.g. 1000000+sin(x))
+        if (self.xmax - self.xmin < 1e-4 * max(abs(self.xmin), abs(self.xmax))
+                or self.ymax - self.ymin < 1e-4 * max(abs(self.ymin), abs(self.ymax))):
+            dtype = np.float64
+        key = (self.xmin, self.xmax, points, dtype)
+        if key != self._x_key:
+            x = np.linspace(self.xmin, self.xmax, points, dtype=dtype)
+            x.flags.writeable = False  # shared by every plotted line
+            self._x_cache = x
+            self._x_key = key
+        return self._x_cache
+    
+    prepare_expression = staticmethod(prepare_expression)
         
     def reset_view(self):
         """Reset to default window settings"""
@@ -130,6 +346,16 @@ class GraphCanvas(FigureCanvasQTAgg):
             self.setup_axes()
             self.draw()
             
+    def schedule_draw(self):
+        """Request a redraw, merging bursts of requests into one"""
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+            
+    def _redraw(self):
+        """Re-sample the curves for the current x-range and draw"""
+        self._update_lines(list(self._func_lines))
+        self.draw()
+            
     def on_mouse_press(self, event):
         """Handle mouse button press"""
         if event.inaxes != self.axes:
@@ -157,7 +383,7 @@ class GraphCanvas(FigureCanvasQTAgg):
         self.xmin, self.xmax = self.axes.get_xlim()
         self.ymin, self.ymax = self.axes.get_ylim()
         
-        self.draw()
+        self.schedule_draw()
         
     def on_scroll(self, event):
         """Handle mouse wheel for zooming"""
@@ -188,17 +414,33 @@ class GraphCanvas(FigureCanvasQTAgg):
         self.ymin = ydata - y_rel * y_range
         self.ymax = self.ymin + y_range
         
-        # Update plot
-        self.setup_axes()
-        self.draw()  # wrap x in parentheses for safety
+        # Update limits and ticks; curves are re-sampled on redraw
+        self._apply_window()
+        self.schedule_draw()
 
 
 class GraphingCalculator:
     """Main graphing interface"""
+    _ANALYSIS_CACHE_SIZE = 64
+    
     def __init__(self):
         self.functions = []  # Store active functions
         self.current_function = ""
         self.trace_point = None
+        # Zeros/intersections/critical points keyed by (kind, exprs, range)
+        self._analysis_cache = OrderedDict()
+        
+    def _cached(self, key, compute, *args):
+        """Return a memoized analysis result, computing it on a miss"""
+        result = self._analysis_cache.get(key)
+        if result is None:
+            result = tuple(compute(*args))
+            self._analysis_cache[key] = result
+            if len(self._analysis_cache) > self._ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        else:
+            self._analysis_cache.move_to_end(key)
+        return list(result)
         
     def set_function(self, expr):
         """Set the current function to plot"""
@@ -207,48 +449,66 @@ class GraphingCalculator:
     def evaluate_at(self, expr, x_val):
         """Evaluate a function at a specific x value"""
         try:
-            x = x_val
-            expr = self.prepare_expression(expr)
-            return eval(expr)
+            return _jit_scalar(expr)(float(x_val))
         except Exception:
             return None
             
     def find_zeros(self, expr, start=-10, end=10, points=1000):
         """Find x-intercepts (zeros) of the function"""
+        return self._cached(('zeros', expr, start, end, points),
+                            self._find_zeros, expr, start, end, points)
+    
+    def _find_zeros(self, expr, start, end, points):
         try:
-            x = np.linspace(start, end, points)
-            expr = self.prepare_expression(expr)
-            y = eval(expr)
+            x = _sample_grid(start, end, points)
+            y = evaluate_expression(expr, x)
             
             # Find where function changes sign
             zeros = []
-            for i in range(len(x)-1):
-                if y[i] * y[i+1] <= 0:  # Sign change detected
-                    # Use binary search to refine the zero
-                    x0 = self._binary_search_zero(expr, x[i], x[i+1])
-                    if x0 is not None:
-                        zeros.append(x0)
+            for i in _sign_changes(y):
+                # Refine the zero inside the bracketing interval
+                x0 = self._refine_zero(expr, x[i], x[i+1])
+                if x0 is not None:
+                    zeros.append(x0)
             return zeros
         except Exception:
             return []
+    
+    def _refine_zero(self, expr, a, b):
+        """Refine a bracketed zero with Brent's method, or bisection without SciPy"""
+        if brentq is None:
+            return self._binary_search_zero(expr, a, b)
+        try:
+            return brentq(_jit_scalar(expr), a, b, xtol=1e-12, maxiter=50)
+        except (ValueError, RuntimeError):
+            # Endpoint signs disagreed with the samples, or no convergence
+            return self._binary_search_zero(expr, a, b)
+        except Exception:
+            return None
             
     def _binary_search_zero(self, expr, a, b, tolerance=1e-10, max_iter=50):
         """Binary search to find precise zero location"""
         try:
-            fa = eval(expr.replace('x', f'({a})'))
-            fb = eval(expr.replace('x', f'({b})'))
+            f = _jit_scalar(expr)
+            fa = f(a)
+            fb = f(b)
             
-            if fa * fb > 0:
+            if fa == 0:
+                return a
+            if fb == 0:
+                return b
+            # Compare signs rather than products, which can over/underflow
+            if (fa < 0.0) == (fb < 0.0):
                 return None
                 
             iteration = 0
             while (b - a) > tolerance and iteration < max_iter:
                 c = (a + b) / 2
-                fc = eval(expr.replace('x', f'({c})'))
+                fc = f(c)
                 
                 if abs(fc) < tolerance:
                     return c
-                elif fa * fc < 0:
+                elif (fa < 0.0) != (fc < 0.0):
                     b = c
                     fb = fc
                 else:
@@ -262,6 +522,10 @@ class GraphingCalculator:
             
     def find_intersections(self, expr1, expr2, start=-10, end=10, points=1000):
         """Find intersection points of two functions"""
+        return self._cached(('intersections', expr1, expr2, start, end, points),
+                            self._find_intersections, expr1, expr2, start, end, points)
+    
+    def _find_intersections(self, expr1, expr2, start, end, points):
         try:
             # Create difference function (f1 - f2)
             diff_expr = f"({expr1}) - ({expr2})"
@@ -280,24 +544,22 @@ class GraphingCalculator:
             
     def find_critical_points(self, expr, start=-10, end=10, points=1000):
         """Find local maxima and minima"""
+        return self._cached(('critical', expr, start, end, points),
+                            self._find_critical_points, expr, start, end, points)
+    
+    def _find_critical_points(self, expr, start, end, points):
         try:
-            x = np.linspace(start, end, points)
-            expr = self.prepare_expression(expr)
-            y = eval(expr)
+            x = _sample_grid(start, end, points)
+            y = evaluate_expression(expr, x)
             
             # Compute numerical derivative
             dx = x[1] - x[0]
             dy = np.diff(y)
             derivative = dy / dx
             
-            # Find where derivative changes sign
-            critical_points = []
-            for i in range(len(derivative)-1):
-                if derivative[i] * derivative[i+1] <= 0:
-                    # Potential critical point
-                    x_crit = x[i]
-                    y_crit = eval(expr.replace('x', f'({x_crit})'))
-                    critical_points.append((x_crit, y_crit))
+            # Find where derivative changes sign; the samples are already in y
+            idx = _sign_changes(derivative)
+            critical_points = list(zip(x[idx].tolist(), y[idx].tolist()))
             return critical_points
         except Exception:
             return []
@@ -313,6 +575,7 @@ class GraphingCalculator:
         """Clear all plotted functions"""
         self.functions = []
         self.current_function = ""
+        self._analysis_cache.clear()
         
     def get_functions(self):
         """Get list of active functions"""
@@ -5,32 +5,56 @@ large duplicated or corrupted content.
 """
 
 import sys
+from collections import deque
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QGridLayout,
     QPushButton, QLabel, QTabWidget, QSizePolicy, QLineEdit,
     QHBoxLayout, QScrollArea
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 from PyQt5.QtGui import QFont
 
 from . import core
-from . import graphing
+
+
+# Keypad buttons as (label, row, column), laid out four per row
+_KEYPAD = tuple(
+    (txt, i // 4, i % 4)
+    for i, txt in enumerate(('7', '8', '9', '÷', '4', '5', '6', '×',
+                             '1', '2', '3', '-', '0', '.', '=', '+'))
+)
 
 
 class CalculatorGUI(QMainWindow):
+    _DIGITS = frozenset('0123456789')
+    _BINARY = {
+        '+': core.safe_add,
+        '-': core.safe_sub,
+        '×': core.safe_mul,
+        '÷': core.safe_div,
+    }
+    _OPS = frozenset(_BINARY)
+    _HISTORY_LIMIT = 200
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Calculator")
         self.setFixedSize(880, 640)
         self.current = "0"
+        self._current_value = 0.0
         self.last = None
         self.op = None
         self.should_reset = False
-        self.history = []
-        try:
-            self.graph_calc = graphing.GraphingCalculator()
-        except Exception:
-            self.graph_calc = None
+        self.history = deque(maxlen=self._HISTORY_LIMIT)
+        self._dispatch = {'.': self._on_dot, '=': self._compute}
+        # Graphing (numpy/matplotlib) is set up on first visit to its tab
+        self.graph_calc = None
+        self.canvas = None
+        self._graph_inited = False
+        # History rows are built on first visit to their tab
+        self.history_area = None
+        self.history_layout = None
         self._build_ui()
 
     def _build_ui(self):
@@ -50,12 +74,10 @@ class CalculatorGUI(QMainWindow):
         v.addWidget(self.display)
 
         grid = QGridLayout()
-        buttons = ['7','8','9','÷','4','5','6','×','1','2','3','-','0','.','=','+']
-        pos = [(r, c) for r in range(4) for c in range(4)]
-        for (r, c), txt in zip(pos, buttons):
+        for txt, r, c in _KEYPAD:
             b = QPushButton(txt)
             b.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            b.clicked.connect(lambda _, t=txt: self._on_button(t))
+            b.clicked.connect(self._on_key_clicked)
             grid.addWidget(b, r, c)
         v.addLayout(grid)
         self.tabs.addTab(calc, "Calc")
@@ -67,106 +89,183 @@ class CalculatorGUI(QMainWindow):
         self.func_input = QLineEdit()
         self.func_input.setPlaceholderText('Enter function, e.g. x**2')
         plot_btn = QPushButton('Plot')
-        plot_btn.clicked.connect(self._on_plot)
+        # Rapid Plot clicks / Enter presses collapse into one plot
+        self._plot_timer = QTimer(self)
+        self._plot_timer.setSingleShot(True)
+        self._plot_timer.setInterval(150)
+        self._plot_timer.timeout.connect(self._on_plot)
+        plot_btn.clicked.connect(self._plot_timer.start)
+        self.func_input.returnPressed.connect(self._plot_timer.start)
         fh.addWidget(self.func_input)
         fh.addWidget(plot_btn)
         gv.addLayout(fh)
-        try:
-            self.canvas = graphing.GraphCanvas(self)
-            gv.addWidget(self.canvas)
-        except Exception:
-            self.canvas = None
-            gv.addWidget(QLabel('Graphing unavailable'))
-        self.tabs.addTab(graph, 'Graph')
+        self._graph_layout = gv
+        self._graph_placeholder = QWidget()
+        gv.addWidget(self._graph_placeholder)
+        self._graph_index = self.tabs.addTab(graph, 'Graph')
 
-        # History tab
+        # History tab (filled in on first visit)
         hist = QWidget()
-        hv = QVBoxLayout(hist)
+        self._history_tab_layout = QVBoxLayout(hist)
+        self._history_index = self.tabs.addTab(hist, 'History')
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _build_history_tab(self):
+        hv = self._history_tab_layout
         self.history_area = QScrollArea()
         self.history_area.setWidgetResizable(True)
         content = QWidget()
         self.history_layout = QVBoxLayout(content)
+        self.history_layout.addStretch()
         self.history_area.setWidget(content)
         hv.addWidget(self.history_area)
         clear_btn = QPushButton('Clear History')
         clear_btn.clicked.connect(self._clear_history)
         hv.addWidget(clear_btn)
-        self.tabs.addTab(hist, 'History')
+        self._refresh_history()
+
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index: int):
+        if index == self._graph_index and not self._graph_inited:
+            self._init_graphing()
+        elif index == self._history_index and self.history_layout is None:
+            self._build_history_tab()
+
+    def _init_graphing(self):
+        self._graph_inited = True
+        try:
+            from . import graphing
+            self.graph_calc = graphing.GraphingCalculator()
+            self.canvas = graphing.GraphCanvas(self)
+            widget = self.canvas
+        except Exception:
+            self.graph_calc = None
+            self.canvas = None
+            widget = QLabel('Graphing unavailable')
+        self._graph_layout.replaceWidget(self._graph_placeholder, widget)
+        self._graph_placeholder.deleteLater()
+
+    @pyqtSlot()
+    def _on_key_clicked(self):
+        self._on_button(self.sender().text())
 
     def _on_button(self, txt: str):
-        if txt.isdigit():
-            if self.should_reset:
-                self.current = txt
-                self.should_reset = False
-            else:
-                self.current = ('' if self.current == '0' else self.current) + txt
-        elif txt == '.':
-            if '.' not in self.current:
-                self.current += '.'
-        elif txt in ('+', '-', '×', '÷'):
-            try:
-                self.last = float(self.current)
-            except Exception:
-                self.last = 0.0
-            self.op = txt
-            self.should_reset = True
-        elif txt == '=':
-            self._compute()
-        self.display.setText(self.current)
+        if txt in self._DIGITS:
+            self._on_digit(txt)
+        elif txt in self._OPS:
+            self._on_operator(txt)
+        else:
+            handler = self._dispatch.get(txt)
+            if handler:
+                handler()
+        self._update_display()
+
+    def _update_display(self):
+        # setText schedules a relayout and repaint even for the same text
+        if self.display.text() != self.current:
+            self.display.setText(self.current)
+
+    def _set_current(self, text: str):
+        """Update the entry text and its numeric value (None if not a number)."""
+        self.current = text
+        try:
+            self._current_value = float(text)
+        except ValueError:
+            self._current_value = None
+
+    def _on_digit(self, txt: str):
+        if self.should_reset:
+            self._set_current(txt)
+            self.should_reset = False
+        else:
+            self._set_current(('' if self.current == '0' else self.current) + txt)
+
+    def _on_dot(self):
+        if '.' not in self.current:
+            self.current += '.'
+
+    def _on_operator(self, txt: str):
+        self.last = self._current_value if self._current_value is not None else 0.0
+        self.op = txt
+        self.should_reset = True
 
     def _compute(self):
         if self.op is None or self.last is None:
             return
         try:
-            cur = float(self.current)
-            if self.op == '+':
-                res = core.safe_add(self.last, cur)
-            elif self.op == '-':
-                res = core.safe_sub(self.last, cur)
-            elif self.op == '×':
-                res = core.safe_mul(self.last, cur)
-            elif self.op == '÷':
-                res = core.safe_div(self.last, cur)
-            else:
-                res = cur
+            cur = self._current_value
+            if cur is None:
+                raise ValueError("Invalid number")
+            fn = self._BINARY.get(self.op)
+            res = fn(self.last, cur) if fn else cur
             out = core.format_result(res)
-            self.history.insert(0, (f"{self.last} {self.op} {cur}", out))
-            if len(self.history) > 200:
-                self.history = self.history[:200]
-            self._refresh_history()
-            self.current = out
+            expr = f"{self.last} {self.op} {cur}"
+            full = len(self.history) == self.history.maxlen
+            self.history.appendleft((expr, out))
+            if self.history_layout is not None:
+                self._prepend_history_row(expr, out, full)
+            self._set_current(out)
         except Exception:
-            self.current = 'Error'
+            self._set_current('Error')
         finally:
             self.op = None
             self.last = None
             self.should_reset = True
 
+    def _prepend_history_row(self, expr: str, res: str, evicted: bool):
+        if evicted:
+            # The deque dropped the oldest entry; reuse its row, which sits
+            # just above the trailing stretch
+            item = self.history_layout.takeAt(self.history_layout.count() - 2)
+            row = item.widget()
+            self._set_history_row(row, expr, res)
+        else:
+            row = self._make_history_row(expr, res)
+        self.history_layout.insertWidget(0, row)
+
     def _refresh_history(self):
-        while self.history_layout.count():
-            item = self.history_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-        for expr, res in self.history:
-            row = QWidget()
-            h = QHBoxLayout(row)
-            lbl = QLabel(f"{expr} = {res}")
-            btn = QPushButton('Recall')
-            btn.clicked.connect(lambda _, v=res: self._recall(v))
-            h.addWidget(lbl)
-            h.addWidget(btn)
-            self.history_layout.addWidget(row)
-        self.history_layout.addStretch()
+        # Hold repaints and relayouts until every row is in place
+        content = self.history_area.widget()
+        content.setUpdatesEnabled(False)
+        self.history_layout.setEnabled(False)
+        try:
+            # Rows sit above the trailing stretch, which stays in place
+            while self.history_layout.count() > 1:
+                self.history_layout.takeAt(0).widget().deleteLater()
+            for expr, res in self.history:
+                row = self._make_history_row(expr, res)
+                self.history_layout.insertWidget(self.history_layout.count() - 1, row)
+        finally:
+            self.history_layout.setEnabled(True)
+            content.setUpdatesEnabled(True)
+
+    def _make_history_row(self, expr: str, res: str) -> QWidget:
+        row = QWidget()
+        h = QHBoxLayout(row)
+        btn = QPushButton('Recall')
+        btn.clicked.connect(self._on_recall_clicked)
+        h.addWidget(QLabel())
+        h.addWidget(btn)
+        self._set_history_row(row, expr, res)
+        return row
+
+    def _set_history_row(self, row: QWidget, expr: str, res: str):
+        row.findChild(QLabel).setText(f"{expr} = {res}")
+        row.findChild(QPushButton).setProperty('value', res)
+
+    @pyqtSlot()
+    def _on_recall_clicked(self):
+        self._recall(self.sender().property('value'))
 
     def _recall(self, v: str):
-        self.current = v
+        self._set_current(v)
         self.tabs.setCurrentIndex(0)
-        self.display.setText(self.current)
+        self._update_display()
 
     def _clear_history(self):
-        self.history = []
-        self._refresh_history()
+        self.history.clear()
+        if self.history_layout is not None:
+            self._refresh_history()
 
     def _on_plot(self):
         expr = self.func_input.text().strip()